@@ -1,6 +1,7 @@
 import pygame  # Main game library
 import random  # For enemy placement
 import sys     # For system exit
+import time    # For measuring the update time budget
 
 # Initializing pygame
 pygame.init()
@@ -11,10 +12,16 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))  # Creating game window
 pygame.display.set_caption("Tank War")  # Title of the game window
 clock = pygame.time.Clock()  # Clock to control FPS
 font = pygame.font.SysFont(None, 36)  # Font for rendering text
+small_font = pygame.font.SysFont(None, 24)  # Font for update stats
 
 # Defining some colors
 WHITE, BLACK, RED, GREEN, BLUE = (255, 255, 255), (0, 0, 0), (200, 0, 0), (0, 255, 0), (0, 0, 255)
 
+# Level-of-detail settings for enemy updates
+NEAR_DISTANCE = 300     # Enemies closer than this to the tank always update every tick
+FAR_INTERVAL = 4        # Far enemies run their full logic once every this many ticks
+UPDATE_BUDGET_MS = 2.0  # Time allowed per frame for far enemy logic
+
 # Base class for all game objects (uses inheritance)
 class GameObject(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height, color):
@@ -115,9 +122,12 @@ class Enemy(GameObject):
         self._speed = speed
 
     def update(self):
-        self._rect.x += self._speed  # Move enemy
         if self._rect.right < 0 or self._rect.left > WIDTH:
             self._speed *= -1  # Change direction if out of bounds
+        self.coast()  # Move enemy
+
+    def coast(self):
+        self._rect.x += self._speed  # Cheap movement only, used when full logic is deferred
 
     def take_damage(self, damage):
         self._health -= damage
@@ -142,6 +152,70 @@ class Boss(Enemy):
         pygame.draw.rect(surface, BLACK, (self._rect.x, self._rect.y - 10, 100, 10))  # Health bar background
         pygame.draw.rect(surface, GREEN, (self._rect.x, self._rect.y - 10, max(0, self._health * 0.33), 10))  # Health
 
+# Scheduler that time-slices enemy updates by distance from the player
+class UpdateScheduler:
+    def __init__(self, near_distance=NEAR_DISTANCE, far_interval=FAR_INTERVAL, budget_ms=UPDATE_BUDGET_MS):
+        if budget_ms <= 0:
+            raise ValueError("budget_ms must be greater than 0.")
+        self._near_distance = near_distance
+        self._far_interval = far_interval
+        self._budget = budget_ms / 1000.0  # Budget in seconds
+        self._screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self._tick = 0
+        self._last_update = {}  # Entity -> tick of its last full update
+        self._stats = {"full": 0, "coasted": 0, "deferred": 0}  # Counts for the last frame
+        self._totals = {"full": 0, "coasted": 0, "deferred": 0}  # Running counts since the scheduler started
+
+    def is_near(self, entity, focus_rect):
+        rect = entity.get_rect()
+        if rect.colliderect(self._screen_rect):
+            return True  # On-screen entities always get full updates
+        return abs(rect.centerx - focus_rect.centerx) <= self._near_distance
+
+    def update(self, entities, focus_rect):
+        self._tick += 1
+        stats = {"full": 0, "coasted": 0, "deferred": 0}
+        last_update = {}
+        far_due = []
+
+        for entity in entities:
+            last = self._last_update.get(entity, self._tick - self._far_interval)  # Unseen entities are due at once
+            if self.is_near(entity, focus_rect):
+                entity.update()  # Near entities update every tick
+                last_update[entity] = self._tick
+                stats["full"] += 1
+            else:
+                last_update[entity] = last
+                if self._tick - last >= self._far_interval:
+                    far_due.append(entity)  # Due for a full update
+                else:
+                    entity.coast()  # Interpolate motion between full updates
+                    stats["coasted"] += 1
+
+        # Most overdue far entities go first so none of them starve
+        far_due.sort(key=lambda e: last_update[e])
+        start = time.perf_counter()
+        for index, entity in enumerate(far_due):
+            # The most overdue entity always runs so progress is guaranteed
+            if index > 0 and time.perf_counter() - start > self._budget:
+                entity.coast()  # Out of budget, defer full logic to a later frame
+                stats["deferred"] += 1
+            else:
+                entity.update()
+                last_update[entity] = self._tick
+                stats["full"] += 1
+
+        self._last_update = last_update  # Drops entities that are no longer alive
+        self._stats = stats
+        for key, count in stats.items():
+            self._totals[key] += count
+
+    def get_stats(self):
+        return dict(self._stats)  # Copy of last frame's counts
+
+    def get_totals(self):
+        return dict(self._totals)  # Copy of running counts
+
 # Main game class that controls levels, UI, logic
 class Game:
     def __init__(self):
@@ -151,6 +225,7 @@ class Game:
         self._enemies = pygame.sprite.Group()
         self._boss = None
         self._game_over = False
+        self._scheduler = UpdateScheduler()  # Level-of-detail updates for enemies
         self.load_level()  # Load initial level
 
     def load_level(self):
@@ -173,9 +248,10 @@ class Game:
 
     def update(self):
         self._tank.update()
-        self._enemies.update()
+        entities = list(self._enemies)
         if self._boss:
-            self._boss.update()
+            entities.append(self._boss)
+        self._scheduler.update(entities, self._tank.get_rect())  # Near enemies every tick, far ones less often
 
         # Collision: projectile vs enemy
         for bullet in self._tank.get_projectiles():
@@ -215,6 +291,9 @@ class Game:
         screen.blit(font.render(f"Lives: {self._tank.get_lives()}", True, WHITE), (10, 40))
         screen.blit(font.render(f"Score: {self._score}", True, WHITE), (10, 70))
         screen.blit(font.render(f"Level: {self._level}", True, WHITE), (10, 100))
+        totals = self._scheduler.get_totals()
+        lod_text = f"Total updates: {totals['full']} full, {totals['coasted']} coasted, {totals['deferred']} deferred"
+        screen.blit(small_font.render(lod_text, True, WHITE), (10, 130))
 
     def render(self):
         screen.fill((30, 30, 30))  # Clear screen